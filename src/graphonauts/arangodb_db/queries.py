@@ -160,13 +160,14 @@ QUERIES: dict[tuple[str, int], Query] = {
         description="Non-Indexed Columns: Join supplier and customer through nations on non-indexed comment keywords",
         query="""
             FOR s IN Supplier
-                FILTER CONTAINS(s.comment, "special")
+                FILTER CONTAINS(s.comment, @keyword)
                 FOR nation IN 1..1 OUTBOUND s located_in
                     FOR c IN 1..1 INBOUND nation located_in
                         FILTER IS_SAME_COLLECTION("Customer", c)
-                        FILTER CONTAINS(c.comment, "special")
+                        FILTER CONTAINS(c.comment, @keyword)
                         RETURN {supplier_name: s.name, customer_name: c.name, customer_comment: c.comment}
         """,
+        params={"keyword": "special"},
     ),
     ("join", 2): Query(
         category="join",
@@ -219,7 +220,7 @@ QUERIES: dict[tuple[str, int], Query] = {
         variant=5,
         description="Neighborhood Search: Find all direct and indirect relationships between customers up to a depth of 3",
         query="""
-            LET c1 = DOCUMENT("Customer/1")
+            LET c1 = DOCUMENT(@customer1)
             FOR c2, e, p IN 1..3 ANY c1 GRAPH "tpch"
                 FILTER IS_SAME_COLLECTION("Customer", c2)
                 FILTER c2._id != c1._id
@@ -230,6 +231,7 @@ QUERIES: dict[tuple[str, int], Query] = {
                     node_types: (FOR v IN p.vertices RETURN PARSE_IDENTIFIER(v._id).collection)
                 }
         """,
+        params={"customer1": "Customer/1"},
         setup=_make_index_setup("Customer", ["custkey"]),
         teardown=_make_index_teardown("Customer", ["custkey"]),
     ),
@@ -238,8 +240,8 @@ QUERIES: dict[tuple[str, int], Query] = {
         variant=6,
         description="Shortest Path: Find the shortest path between two customers",
         query="""
-            LET c1 = DOCUMENT("Customer/1")
-            LET c2 = DOCUMENT("Customer/2")
+            LET c1 = DOCUMENT(@customer1)
+            LET c2 = DOCUMENT(@customer2)
             LET path = (
                 FOR v, e IN ANY SHORTEST_PATH c1 TO c2 GRAPH "tpch"
                     RETURN {vertex: v, edge: e}
@@ -256,6 +258,7 @@ QUERIES: dict[tuple[str, int], Query] = {
                 )
             }
         """,
+        params={"customer1": "Customer/1", "customer2": "Customer/2"},
         setup=_make_index_setup("Customer", ["custkey"]),
         teardown=_make_index_teardown("Customer", ["custkey"]),
     ),
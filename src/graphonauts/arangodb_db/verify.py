@@ -3,27 +3,29 @@
 Each query counts documents in a specific collection (document or edge) and the
 result is compared against the expected TPC-H Scale Factor 1 values.
 
-AQL ``COLLECT WITH COUNT`` is used for efficient counting. Results are returned
-as ``{count: N}`` to match the format expected by the verification command.
+AQL ``LENGTH()`` applied to a collection is answered from the collection's
+document count, so no documents are scanned or shipped to the client. Results
+are returned as ``{count: N}`` to match the format expected by the verification
+command.
 """
 
 from graphonauts.base.verify import VerifyQuery
 
 VERIFY_QUERIES: list[VerifyQuery] = [
     # Nodes (document collections)
-    VerifyQuery("Region", "FOR doc IN Region COLLECT WITH COUNT INTO c RETURN {count: c}"),
-    VerifyQuery("Nation", "FOR doc IN Nation COLLECT WITH COUNT INTO c RETURN {count: c}"),
-    VerifyQuery("Supplier", "FOR doc IN Supplier COLLECT WITH COUNT INTO c RETURN {count: c}"),
-    VerifyQuery("Customer", "FOR doc IN Customer COLLECT WITH COUNT INTO c RETURN {count: c}"),
-    VerifyQuery("Part", "FOR doc IN Part COLLECT WITH COUNT INTO c RETURN {count: c}"),
-    VerifyQuery("Order", "FOR doc IN `Order` COLLECT WITH COUNT INTO c RETURN {count: c}"),
-    VerifyQuery("LineItem", "FOR doc IN LineItem COLLECT WITH COUNT INTO c RETURN {count: c}"),
+    VerifyQuery("Region", "RETURN {count: LENGTH(Region)}"),
+    VerifyQuery("Nation", "RETURN {count: LENGTH(Nation)}"),
+    VerifyQuery("Supplier", "RETURN {count: LENGTH(Supplier)}"),
+    VerifyQuery("Customer", "RETURN {count: LENGTH(Customer)}"),
+    VerifyQuery("Part", "RETURN {count: LENGTH(Part)}"),
+    VerifyQuery("Order", "RETURN {count: LENGTH(`Order`)}"),
+    VerifyQuery("LineItem", "RETURN {count: LENGTH(LineItem)}"),
     # Relationships (edge collections)
-    VerifyQuery("BELONGS_TO", "FOR doc IN belongs_to COLLECT WITH COUNT INTO c RETURN {count: c}"),
-    VerifyQuery("LOCATED_IN", "FOR doc IN located_in COLLECT WITH COUNT INTO c RETURN {count: c}"),
-    VerifyQuery("SUPPLIES", "FOR doc IN supplies COLLECT WITH COUNT INTO c RETURN {count: c}"),
-    VerifyQuery("PLACED", "FOR doc IN placed COLLECT WITH COUNT INTO c RETURN {count: c}"),
-    VerifyQuery("CONTAINS", "FOR doc IN `contains` COLLECT WITH COUNT INTO c RETURN {count: c}"),
-    VerifyQuery("OF_PART", "FOR doc IN of_part COLLECT WITH COUNT INTO c RETURN {count: c}"),
-    VerifyQuery("SUPPLIED_BY", "FOR doc IN supplied_by COLLECT WITH COUNT INTO c RETURN {count: c}"),
+    VerifyQuery("BELONGS_TO", "RETURN {count: LENGTH(belongs_to)}"),
+    VerifyQuery("LOCATED_IN", "RETURN {count: LENGTH(located_in)}"),
+    VerifyQuery("SUPPLIES", "RETURN {count: LENGTH(supplies)}"),
+    VerifyQuery("PLACED", "RETURN {count: LENGTH(placed)}"),
+    VerifyQuery("CONTAINS", "RETURN {count: LENGTH(`contains`)}"),
+    VerifyQuery("OF_PART", "RETURN {count: LENGTH(of_part)}"),
+    VerifyQuery("SUPPLIED_BY", "RETURN {count: LENGTH(supplied_by)}"),
 ]
@@ -27,11 +27,17 @@ from graphonauts.commands._common import get_client
 from utils import printer
 
 
+async def _afetch_count(client: BaseClient, vq: VerifyQuery) -> int:
+    """Run a single verification query and return its count (0 if no rows)."""
+    records = await client.afetch(vq.query)
+    return records[0]["count"] if records else 0
+
+
 async def _run_verification(client: BaseClient, queries: list[VerifyQuery]) -> bool:
     """Execute all verification queries and report results in a formatted summary table.
 
-    For each ``VerifyQuery`` in the provided list, the corresponding count query is
-    executed against the database via the client. The returned count is compared to
+    The count queries are independent, so all of them are dispatched concurrently
+    and their round trips overlap. Each returned count is compared to
     the expected value from ``EXPECTED_COUNTS``. Results are accumulated and printed
     as a table with columns for entity name, expected count, actual count, and
     pass/fail status.
@@ -51,9 +57,8 @@ async def _run_verification(client: BaseClient, queries: list[VerifyQuery]) -> b
     failed = 0
     results: list[tuple[str, int, int, bool]] = []
 
-    for vq in queries:
-        records = await client.afetch(vq.query)
-        actual = records[0]["count"] if records else 0
+    counts = await asyncio.gather(*(_afetch_count(client, vq) for vq in queries))
+    for vq, actual in zip(queries, counts, strict=True):
         expected = EXPECTED_COUNTS[vq.entity]
         ok = actual == expected
         results.append((vq.entity, expected, actual, ok))
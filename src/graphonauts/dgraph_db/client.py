@@ -139,15 +139,18 @@ class DgraphClient:
             raise RuntimeError("Client is not connected. Call 'connect()' first.")
         await self.client.alter(pydgraph.Operation(drop_all=True))
 
-    async def amutate(self, data: list[dict[str, Any]]) -> dict[str, str]:
-        """Execute a JSON mutation and return the blank-node UID mapping.
+    async def amutate_json(self, *bodies: str) -> dict[str, str]:
+        """Execute pre-serialised JSON mutations and return the blank-node UID mapping.
 
-        Each dictionary in ``data`` represents a node or an update to an existing
-        node. Blank node references (``uid`` values starting with ``_:``) are
-        resolved by Dgraph and the assigned UIDs are returned in the response.
+        Each body is a JSON array of nodes, or of updates to existing nodes, and is
+        passed to the server as ``set_json`` as-is, so callers serialise whole
+        batches once instead of handing over per-object dicts. Blank node
+        references (``uid`` values starting with ``_:``) are resolved by Dgraph.
+        All bodies are sent as mutations of a single request and committed in
+        one transaction.
 
         Args:
-            data: List of JSON-serializable dicts representing nodes/edges.
+            bodies: JSON arrays (or objects) of nodes/edges to set.
 
         Returns:
             A dictionary mapping blank node labels (without the ``_:`` prefix)
@@ -158,7 +161,8 @@ class DgraphClient:
 
         txn = self.client.txn()
         try:
-            response = await txn.mutate(set_obj=data, commit_now=True)
+            mutations = [pydgraph.Mutation(set_json=body.encode()) for body in bodies]
+            response = await txn.do_request(txn.create_request(mutations=mutations, commit_now=True))
             return dict(response.uids)
         finally:
             await txn.discard()
@@ -16,8 +16,10 @@ Loading order follows entity dependencies:
     Region -> Nation -> Supplier/Customer -> Part -> PartSupp -> Orders -> LineItems
 """
 
-import datetime
-from typing import Any
+import asyncio
+from collections.abc import Iterator
+
+import pandas as pd  # type: ignore
 
 from graphonauts.base.tpch import (
     CHUNK_SIZE,
@@ -32,8 +34,8 @@ from graphonauts.base.tpch import (
     PARTSUPP,
     REGION,
     SUPPLIER,
-    read_entity,
-    read_entity_chunks,
+    read_entity_frame,
+    read_entity_frame_chunks,
     total_batches,
 )
 from graphonauts.dgraph_db.client import DgraphClient
@@ -167,23 +169,72 @@ type LineItem {
 }
 """
 
+# Mutation batches awaiting commit per entity. Concurrent batches touch
+# disjoint nodes, or append distinct values to list predicates, so Dgraph's
+# conflict detection does not abort them.
+_MUTATIONS_IN_FLIGHT = 4
+
+
+def _blank_nodes(prefix: str, keys: pd.Series) -> pd.Series:
+    """Build ``_:{prefix}{key}`` blank node labels for a whole column of keys.
+
+    Labels are produced with one vectorized string concatenation instead of a
+    per-row f-string; ``_cache_uids`` parses the key back out of the label.
+    """
+    return "_:" + prefix + keys.astype(str)
+
+
+def _uid_refs(uids: dict[int, str], keys: pd.Series) -> list[dict[str, str]]:
+    """Resolve a column of primary keys to ``{"uid": ...}`` edge references."""
+    return [{"uid": uids[key]} for key in keys.tolist()]
 
-def _serialize_date(value: Any) -> str:
-    """Convert a ``datetime.date`` to RFC 3339 format for Dgraph's ``dateTime`` type.
 
-    Dgraph requires dates in RFC 3339 format (``YYYY-MM-DDT00:00:00Z``). TPC-H date
-    columns are returned as ``datetime.date`` objects by pandas and must be converted
-    before inclusion in JSON mutations.
+def _rfc3339(dates: pd.Series) -> pd.Series:
+    """Convert ISO date strings to RFC 3339 for Dgraph's ``dateTime`` type.
+
+    Dgraph requires dates in RFC 3339 format (``YYYY-MM-DDT00:00:00Z``). Date
+    columns are read as ``YYYY-MM-DD`` strings, so a single suffix
+    concatenation over the column yields midnight UTC timestamps.
+    """
+    return dates + "T00:00:00Z"
+
+
+def _uid_lists(parents: dict[int, str], keys: pd.Series, children: pd.Series, predicate: str) -> str:
+    """Serialise edges from cached parent nodes to new child nodes, one object per parent.
+
+    Children sharing a parent within a batch (e.g., the line items of one order)
+    are appended through a single ``{"uid": parent, predicate: [...]}`` object
+    instead of one object per edge, which shrinks the mutation body.
 
     Args:
-        value: A ``datetime.date`` instance.
+        parents: UID cache of the parent entity, keyed by primary key.
+        keys: Parent primary key of each child row.
+        children: Blank node label of each child row, aligned with ``keys``.
+        predicate: The list predicate linking parent to child (e.g., ``"placed"``).
 
     Returns:
-        An RFC 3339 formatted date string at midnight UTC.
+        A JSON array of parent update objects.
     """
-    if isinstance(value, datetime.date):
-        return f"{value.isoformat()}T00:00:00Z"
-    return str(value)
+    groups = children.groupby(keys.to_numpy(), sort=False).agg(list)
+    return _json(
+        pd.DataFrame(
+            {
+                "uid": [parents[key] for key in groups.index.tolist()],
+                predicate: [[{"uid": child} for child in group] for group in groups.tolist()],
+            }
+        ),
+        ["uid", predicate],
+    )
+
+
+def _json(df: pd.DataFrame, columns: list[str]) -> str:
+    """Serialise ``columns`` of ``df`` as a JSON array of mutation objects.
+
+    pandas encodes the columns directly in C, so no intermediate dict is built
+    per row; only edge-reference columns hold Python objects. The default
+    ``double_precision`` of 10 round-trips TPC-H's two-decimal values exactly.
+    """
+    return df[columns].to_json(orient="records")  # type: ignore[no-any-return]
 
 
 class DgraphLoader:
@@ -211,7 +262,7 @@ class DgraphLoader:
             key_prefix: The prefix used in blank node labels (e.g., ``"region_"``).
                 Blank nodes are named ``_:{prefix}{key}``, so the mapping key is
                 extracted by stripping the prefix.
-            uids: The blank-node-to-UID mapping returned by ``amutate()``.
+            uids: The blank-node-to-UID mapping returned by ``amutate_json()``.
         """
         if entity not in self._uid_cache:
             self._uid_cache[entity] = {}
@@ -253,106 +304,96 @@ class DgraphLoader:
 
     async def aload_region(self) -> None:
         """Load Region nodes (5 rows)."""
-        rows = read_entity(REGION)
-        data = [
-            {
-                "uid": f"_:region_{row['regionkey']}",
-                "dgraph.type": "Region",
-                "regionkey": row["regionkey"],
-                "name": row["name"],
-                "comment": row["comment"],
-            }
-            for row in rows
-        ]
+        df = read_entity_frame(REGION)
+        df["uid"] = _blank_nodes("region_", df["regionkey"])
+        df["dgraph.type"] = "Region"
+        nodes = _json(df, ["uid", "dgraph.type", "regionkey", "name", "comment"])
         printer.task_progress("Loading regions", 1, 1)
-        uids = await self.client.amutate(data)
+        uids = await self.client.amutate_json(nodes)
         self._cache_uids("Region", "region_", uids)
 
     async def aload_nation(self) -> None:
         """Load Nation nodes (25 rows) and belongs_to edges to Region."""
-        rows = read_entity(NATION)
-        data = [
-            {
-                "uid": f"_:nation_{row['nationkey']}",
-                "dgraph.type": "Nation",
-                "nationkey": row["nationkey"],
-                "name": row["name"],
-                "comment": row["comment"],
-                "belongs_to": {"uid": self._uid_cache["Region"][row["regionkey"]]},
-            }
-            for row in rows
-        ]
+        df = read_entity_frame(NATION)
+        df["uid"] = _blank_nodes("nation_", df["nationkey"])
+        df["dgraph.type"] = "Nation"
+        df["belongs_to"] = _uid_refs(self._uid_cache["Region"], df["regionkey"])
+        nodes = _json(df, ["uid", "dgraph.type", "nationkey", "name", "comment", "belongs_to"])
         printer.task_progress("Loading nations", 1, 1)
-        uids = await self.client.amutate(data)
+        uids = await self.client.amutate_json(nodes)
         self._cache_uids("Nation", "nation_", uids)
 
     async def aload_supplier(self) -> None:
         """Load Supplier nodes (10K rows) and located_in edges to Nation."""
-        rows = read_entity(SUPPLIER)
-        data = [
-            {
-                "uid": f"_:supplier_{row['suppkey']}",
-                "dgraph.type": "Supplier",
-                "suppkey": row["suppkey"],
-                "name": row["name"],
-                "address": row["address"],
-                "phone": row["phone"],
-                "acctbal": row["acctbal"],
-                "comment": row["comment"],
-                "located_in": {"uid": self._uid_cache["Nation"][row["nationkey"]]},
-            }
-            for row in rows
-        ]
+        df = read_entity_frame(SUPPLIER)
+        df["uid"] = _blank_nodes("supplier_", df["suppkey"])
+        df["dgraph.type"] = "Supplier"
+        df["located_in"] = _uid_refs(self._uid_cache["Nation"], df["nationkey"])
+        nodes = _json(
+            df, ["uid", "dgraph.type", "suppkey", "name", "address", "phone", "acctbal", "comment", "located_in"]
+        )
         printer.task_progress("Loading suppliers", 1, 1)
-        uids = await self.client.amutate(data)
+        uids = await self.client.amutate_json(nodes)
         self._cache_uids("Supplier", "supplier_", uids)
 
     async def aload_customer(self) -> None:
         """Load Customer nodes (150K rows) and located_in edges to Nation."""
-        num_batches = total_batches("customers", CHUNK_SIZE)
-        for i, rows in enumerate(read_entity_chunks(CUSTOMER, CHUNK_SIZE), 1):
-            data = [
-                {
-                    "uid": f"_:customer_{row['custkey']}",
-                    "dgraph.type": "Customer",
-                    "custkey": row["custkey"],
-                    "name": row["name"],
-                    "address": row["address"],
-                    "phone": row["phone"],
-                    "acctbal": row["acctbal"],
-                    "mktsegment": row["mktsegment"],
-                    "comment": row["comment"],
-                    "located_in": {"uid": self._uid_cache["Nation"][row["nationkey"]]},
-                }
-                for row in rows
-            ]
-            printer.task_progress("Loading customers", i, num_batches)
-            uids = await self.client.amutate(data)
-            self._cache_uids("Customer", "customer_", uids)
+
+        def batches() -> Iterator[tuple[str, ...]]:
+            for df in read_entity_frame_chunks(CUSTOMER, CHUNK_SIZE):
+                df["uid"] = _blank_nodes("customer_", df["custkey"])
+                df["dgraph.type"] = "Customer"
+                df["located_in"] = _uid_refs(self._uid_cache["Nation"], df["nationkey"])
+                nodes = _json(
+                    df,
+                    [
+                        "uid",
+                        "dgraph.type",
+                        "custkey",
+                        "name",
+                        "address",
+                        "phone",
+                        "acctbal",
+                        "mktsegment",
+                        "comment",
+                        "located_in",
+                    ],
+                )
+                yield (nodes,)
+
+        await self._amutate_batches(
+            "Loading customers", total_batches("customers", CHUNK_SIZE), batches(), cache=("Customer", "customer_")
+        )
 
     async def aload_part(self) -> None:
         """Load Part nodes (200K rows), no edges."""
-        num_batches = total_batches("parts", CHUNK_SIZE)
-        for i, rows in enumerate(read_entity_chunks(PART, CHUNK_SIZE), 1):
-            data = [
-                {
-                    "uid": f"_:part_{row['partkey']}",
-                    "dgraph.type": "Part",
-                    "partkey": row["partkey"],
-                    "name": row["name"],
-                    "mfgr": row["mfgr"],
-                    "brand": row["brand"],
-                    "ptype": row["type"],
-                    "size": row["size"],
-                    "container": row["container"],
-                    "retailprice": row["retailprice"],
-                    "comment": row["comment"],
-                }
-                for row in rows
-            ]
-            printer.task_progress("Loading parts", i, num_batches)
-            uids = await self.client.amutate(data)
-            self._cache_uids("Part", "part_", uids)
+
+        def batches() -> Iterator[tuple[str, ...]]:
+            for df in read_entity_frame_chunks(PART, CHUNK_SIZE):
+                df["uid"] = _blank_nodes("part_", df["partkey"])
+                df["dgraph.type"] = "Part"
+                df = df.rename(columns={"type": "ptype"})
+                nodes = _json(
+                    df,
+                    [
+                        "uid",
+                        "dgraph.type",
+                        "partkey",
+                        "name",
+                        "mfgr",
+                        "brand",
+                        "ptype",
+                        "size",
+                        "container",
+                        "retailprice",
+                        "comment",
+                    ],
+                )
+                yield (nodes,)
+
+        await self._amutate_batches(
+            "Loading parts", total_batches("parts", CHUNK_SIZE), batches(), cache=("Part", "part_")
+        )
 
     async def aload_partsupp(self) -> None:
         """Load supplies edges with facets (800K rows).
@@ -361,99 +402,148 @@ class DgraphLoader:
         facets for availqty, supplycost, and comment. The mutation updates existing
         Supplier nodes by appending to their ``supplies`` edge list.
         """
-        num_batches = total_batches("part_suppliers", CHUNK_SIZE_PARTSUPP)
-        for i, rows in enumerate(read_entity_chunks(PARTSUPP, CHUNK_SIZE_PARTSUPP), 1):
-            data = [
-                {
-                    "uid": self._uid_cache["Supplier"][row["suppkey"]],
-                    "supplies": {
-                        "uid": self._uid_cache["Part"][row["partkey"]],
-                        "supplies|availqty": row["availqty"],
-                        "supplies|supplycost": row["supplycost"],
-                        "supplies|comment": row["comment"],
-                    },
-                }
-                for row in rows
-            ]
-            printer.task_progress("Loading part_suppliers", i, num_batches)
-            await self.client.amutate(data)
+
+        def batches() -> Iterator[tuple[str, ...]]:
+            for df in read_entity_frame_chunks(PARTSUPP, CHUNK_SIZE_PARTSUPP):
+                supplier_uids = [self._uid_cache["Supplier"][key] for key in df["suppkey"].tolist()]
+                df["uid"] = [self._uid_cache["Part"][key] for key in df["partkey"].tolist()]
+                df = df.rename(
+                    columns={
+                        "availqty": "supplies|availqty",
+                        "supplycost": "supplies|supplycost",
+                        "comment": "supplies|comment",
+                    }
+                )
+                edges = df[["uid", "supplies|availqty", "supplies|supplycost", "supplies|comment"]].to_dict("records")
+                suppliers = _json(pd.DataFrame({"uid": supplier_uids, "supplies": edges}), ["uid", "supplies"])
+                yield (suppliers,)
+
+        await self._amutate_batches(
+            "Loading part_suppliers", total_batches("part_suppliers", CHUNK_SIZE_PARTSUPP), batches()
+        )
 
     async def aload_orders(self) -> None:
         """Load Order nodes (1.5M rows) and placed edges from Customer.
 
         Each mutation batch creates Order nodes and simultaneously updates Customer
-        nodes to add ``placed`` edges pointing to the new Orders.
+        nodes to add ``placed`` edges pointing to the new Orders, with one update
+        per Customer in the batch.
         """
-        num_batches = total_batches("orders", CHUNK_SIZE_ORDERS)
-        for i, rows in enumerate(read_entity_chunks(ORDER, CHUNK_SIZE_ORDERS), 1):
-            data: list[dict[str, Any]] = []
-            for row in rows:
-                order_blank = f"_:order_{row['orderkey']}"
-                data.append(
-                    {
-                        "uid": order_blank,
-                        "dgraph.type": "Order",
-                        "orderkey": row["orderkey"],
-                        "orderstatus": row["orderstatus"],
-                        "totalprice": row["totalprice"],
-                        "orderdate": _serialize_date(row["orderdate"]),
-                        "orderpriority": row["orderpriority"],
-                        "clerk": row["clerk"],
-                        "shippriority": row["shippriority"],
-                        "comment": row["comment"],
-                    }
-                )
-                data.append(
-                    {
-                        "uid": self._uid_cache["Customer"][row["custkey"]],
-                        "placed": [{"uid": order_blank}],
-                    }
+
+        def batches() -> Iterator[tuple[str, ...]]:
+            for df in read_entity_frame_chunks(ORDER, CHUNK_SIZE_ORDERS, parse_dates=False):
+                df["uid"] = _blank_nodes("order_", df["orderkey"])
+                df["dgraph.type"] = "Order"
+                df["orderdate"] = _rfc3339(df["orderdate"])
+                nodes = _json(
+                    df,
+                    [
+                        "uid",
+                        "dgraph.type",
+                        "orderkey",
+                        "orderstatus",
+                        "totalprice",
+                        "orderdate",
+                        "orderpriority",
+                        "clerk",
+                        "shippriority",
+                        "comment",
+                    ],
                 )
-            printer.task_progress("Loading orders", i, num_batches)
-            uids = await self.client.amutate(data)
-            self._cache_uids("Order", "order_", uids)
+                customers = _uid_lists(self._uid_cache["Customer"], df["custkey"], df["uid"], "placed")
+                yield nodes, customers
+
+        await self._amutate_batches(
+            "Loading orders", total_batches("orders", CHUNK_SIZE_ORDERS), batches(), cache=("Order", "order_")
+        )
 
     async def aload_lineitem(self) -> None:
         """Load LineItem nodes (6M rows) and three edge types per row.
 
         Each mutation batch creates LineItem nodes with ``of_part`` and ``supplied_by``
-        edges, and simultaneously updates Order nodes to add ``contains`` edges.
+        edges, and simultaneously updates Order nodes to add ``contains`` edges,
+        with one update per Order in the batch.
         LineItem UIDs are not cached as no subsequent entity references them.
         """
-        num_batches = total_batches("line_items", CHUNK_SIZE_LINEITEM)
-        for i, rows in enumerate(read_entity_chunks(LINEITEM, CHUNK_SIZE_LINEITEM), 1):
-            data: list[dict[str, Any]] = []
-            for row in rows:
-                li_blank = f"_:li_{row['orderkey']}_{row['linenumber']}"
-                data.append(
-                    {
-                        "uid": li_blank,
-                        "dgraph.type": "LineItem",
-                        "linenumber": row["linenumber"],
-                        "quantity": row["quantity"],
-                        "extendedprice": row["extendedprice"],
-                        "discount": row["discount"],
-                        "tax": row["tax"],
-                        "returnflag": row["returnflag"],
-                        "linestatus": row["linestatus"],
-                        "shipdate": _serialize_date(row["shipdate"]),
-                        "commitdate": _serialize_date(row["commitdate"]),
-                        "receiptdate": _serialize_date(row["receiptdate"]),
-                        "shipinstruct": row["shipinstruct"],
-                        "shipmode": row["shipmode"],
-                        "comment": row["comment"],
-                        "of_part": {"uid": self._uid_cache["Part"][row["partkey"]]},
-                        "supplied_by": {"uid": self._uid_cache["Supplier"][row["suppkey"]]},
-                    }
-                )
-                data.append(
-                    {
-                        "uid": self._uid_cache["Order"][row["orderkey"]],
-                        "contains": [{"uid": li_blank}],
-                    }
+
+        def batches() -> Iterator[tuple[str, ...]]:
+            for df in read_entity_frame_chunks(LINEITEM, CHUNK_SIZE_LINEITEM, parse_dates=False):
+                # linenumber is 1-7, so orderkey * 10 + linenumber is a unique line item key
+                df["uid"] = _blank_nodes("li_", df["orderkey"] * 10 + df["linenumber"])
+                df["dgraph.type"] = "LineItem"
+                for col in ("shipdate", "commitdate", "receiptdate"):
+                    df[col] = _rfc3339(df[col])
+                df["of_part"] = _uid_refs(self._uid_cache["Part"], df["partkey"])
+                df["supplied_by"] = _uid_refs(self._uid_cache["Supplier"], df["suppkey"])
+                nodes = _json(
+                    df,
+                    [
+                        "uid",
+                        "dgraph.type",
+                        "linenumber",
+                        "quantity",
+                        "extendedprice",
+                        "discount",
+                        "tax",
+                        "returnflag",
+                        "linestatus",
+                        "shipdate",
+                        "commitdate",
+                        "receiptdate",
+                        "shipinstruct",
+                        "shipmode",
+                        "comment",
+                        "of_part",
+                        "supplied_by",
+                    ],
                 )
-            printer.task_progress("Loading line_items", i, num_batches)
-            await self.client.amutate(data)
+                orders = _uid_lists(self._uid_cache["Order"], df["orderkey"], df["uid"], "contains")
+                yield nodes, orders
+
+        await self._amutate_batches("Loading line_items", total_batches("line_items", CHUNK_SIZE_LINEITEM), batches())
+
+    async def _amutate_batches(
+        self,
+        label: str,
+        num_batches: int,
+        batches: Iterator[tuple[str, ...]],
+        cache: tuple[str, str] | None = None,
+    ) -> None:
+        """Send mutation batches with up to ``_MUTATIONS_IN_FLIGHT`` awaiting commit.
+
+        Batches are built from ``batches`` in a worker thread while earlier
+        mutations are still in flight, so reading the chunk and serialising its
+        JSON overlap with the server committing the previous ones instead of
+        blocking the event loop. pandas releases the GIL for most of that work.
+        Progress counts committed batches, as in the other loaders.
+
+        Args:
+            label: Progress message (e.g., ``"Loading customers"``).
+            num_batches: Total number of batches, for progress display.
+            batches: Iterator of mutation bodies, one tuple per batch, passed to
+                ``amutate_json()``.
+            cache: ``(entity, key_prefix)`` under which to cache the returned
+                UIDs, or ``None`` when no later entity references them.
+        """
+        slots = asyncio.Semaphore(_MUTATIONS_IN_FLIGHT)
+
+        completed = 0
+
+        async def _amutate(bodies: tuple[str, ...]) -> None:
+            nonlocal completed
+            try:
+                uids = await self.client.amutate_json(*bodies)
+            finally:
+                slots.release()
+            if cache is not None:
+                self._cache_uids(*cache, uids)
+            completed += 1
+            printer.task_progress(label, completed, num_batches)
+
+        async with asyncio.TaskGroup() as tg:
+            while (bodies := await asyncio.to_thread(next, batches, None)) is not None:
+                await slots.acquire()
+                tg.create_task(_amutate(bodies))
 
     async def aclear(self) -> None:
         """Remove all data, schema, and types from Dgraph."""
@@ -11,6 +11,14 @@ from typing import Any
 
 from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncSession
 
+# Bolt connections held by the driver. The loader runs 4 worker sessions at a
+# time; the driver default of 100 would let a runaway caller open far more
+# server-side sessions than the benchmark ever needs.
+_POOL_SIZE = 16
+
+# Seconds to wait for a free pooled connection before failing
+_ACQUISITION_TIMEOUT = 60.0
+
 
 class Neo4jClient:
     """Async Neo4j client with connection management and query execution."""
@@ -28,9 +36,17 @@ class Neo4jClient:
         self.driver: AsyncDriver | None = None
 
     def connect(self) -> None:
+        """Create the driver and its connection pool.
+
+        The pool size and acquisition timeout default to ``_POOL_SIZE`` and
+        ``_ACQUISITION_TIMEOUT`` and can be overridden with the optional
+        ``pool_size`` and ``acquisition_timeout`` config keys.
+        """
         self.driver = AsyncGraphDatabase.driver(
             uri=self.config["uri"],
             auth=(self.config["user"], self.config["password"]),
+            max_connection_pool_size=self.config.get("pool_size", _POOL_SIZE),
+            connection_acquisition_timeout=self.config.get("acquisition_timeout", _ACQUISITION_TIMEOUT),
         )
 
     async def areconnect(self) -> None:
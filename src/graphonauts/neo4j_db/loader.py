@@ -1,16 +1,23 @@
 """Neo4j data loader for TPC-H dataset.
 
 Loads 8 TPC-H entity types into Neo4j as a property graph with nodes and relationships.
-Uses CALL { ... } IN TRANSACTIONS for batched writes and CONCURRENT TRANSACTIONS
-for parallel ingestion of large tables.
+Uses CALL { ... } IN [CONCURRENT] TRANSACTIONS for the tables loaded in one statement.
+Larger tables are written in batches, one managed transaction per batch, submitted
+concurrently from several sessions at a time.
 
 Loading order follows entity dependencies:
     Region -> Nation -> Supplier/Customer -> Part -> PartSupp -> Orders -> LineItems
 
-Temporary indexes are created on key columns before loading (for MATCH lookups during
-relationship creation) and dropped after loading (for fair query benchmarking).
+Temporary indexes are created on key columns as each entity finishes loading (for MATCH
+lookups during relationship creation) and dropped after loading (for fair query benchmarking).
 """
 
+import asyncio
+from collections.abc import Iterator
+from typing import Any
+
+from neo4j import AsyncManagedTransaction
+
 from graphonauts.base.tpch import (
     CHUNK_SIZE,
     CHUNK_SIZE_LINEITEM,
@@ -31,6 +38,25 @@ from graphonauts.base.tpch import (
 from graphonauts.neo4j_db.client import Neo4jClient
 from utils import printer
 
+# Workers writing batches concurrently per entity, each with its own session
+_BATCHES_IN_FLIGHT = 4
+
+# Temporary key indexes used by MATCH lookups while loading, dropped afterwards.
+_KEY_INDEXES = {
+    "region_key": "CREATE INDEX region_key IF NOT EXISTS FOR (region:Region) ON (region.regionkey)",
+    "nation_key": "CREATE INDEX nation_key IF NOT EXISTS FOR (nation:Nation) ON (nation.nationkey)",
+    "supplier_key": "CREATE INDEX supplier_key IF NOT EXISTS FOR (supplier:Supplier) ON (supplier.suppkey)",
+    "customer_key": "CREATE INDEX customer_key IF NOT EXISTS FOR (customer:Customer) ON (customer.custkey)",
+    "part_key": "CREATE INDEX part_key IF NOT EXISTS FOR (part:Part) ON (part.partkey)",
+    "order_key": "CREATE INDEX order_key IF NOT EXISTS FOR (order:Order) ON (order.orderkey)",
+}
+
+
+async def _arun_consumed(tx: AsyncManagedTransaction, query: str, params: dict[str, Any] | None = None) -> None:
+    """Run ``query`` in ``tx`` and consume its result so errors surface inside the transaction."""
+    result = await tx.run(query, params)
+    await result.consume()
+
 
 class Neo4jLoader:
     """Loads TPC-H data into Neo4j with batch progress printing.
@@ -51,24 +77,25 @@ class Neo4jLoader:
             await self.aclear()
             printer.task_done("Clearing database")
 
-            printer.task_start("Setting up indexes")
-            await self._acreate_indices()
-            printer.task_done("Setting up indexes")
-
-            steps: list[tuple[str, str]] = [
-                ("regions", "aload_region"),
-                ("nations", "aload_nation"),
-                ("suppliers", "aload_supplier"),
-                ("customers", "aload_customer"),
-                ("parts", "aload_part"),
-                ("part_suppliers", "aload_partsupp"),
-                ("orders", "aload_orders"),
-                ("line_items", "aload_lineitem"),
+            # Each key index is built once its entity is loaded, from a single scan
+            # of the finished label, instead of being maintained on every insert.
+            # Dependent entities only load after the index is online.
+            steps: list[tuple[str, str, str | None]] = [
+                ("regions", "aload_region", "region_key"),
+                ("nations", "aload_nation", "nation_key"),
+                ("suppliers", "aload_supplier", "supplier_key"),
+                ("customers", "aload_customer", "customer_key"),
+                ("parts", "aload_part", "part_key"),
+                ("part_suppliers", "aload_partsupp", None),
+                ("orders", "aload_orders", "order_key"),
+                ("line_items", "aload_lineitem", None),
             ]
 
-            for label, method_name in steps:
+            for label, method_name, index in steps:
                 printer.task_start(f"Loading {label}")
                 await getattr(self, method_name)()
+                if index is not None:
+                    await self._acreate_index(index)
                 printer.task_done(f"Loading {label}")
 
             printer.task_start("Dropping indexes")
@@ -84,6 +111,12 @@ class Neo4jLoader:
             } IN TRANSACTIONS OF 5 ROWS
         """
         printer.task_progress("Loading regions", 1, 1)
+        # Region, nation and supplier are small enough to load as one statement
+        # over the whole file instead of through _arun_batches. Nothing else
+        # writes while it runs, so there is no lock contention for a managed
+        # transaction's retries to absorb, and the server splits the rows into
+        # inner transactions itself. Neo4j only accepts CALL { ... } IN
+        # TRANSACTIONS in an auto-commit transaction, hence session.run.
         async with self.client.asession() as session:
             await session.run(query, rows=rows)
 
@@ -97,6 +130,7 @@ class Neo4jLoader:
             } IN TRANSACTIONS OF 25 ROWS
         """
         printer.task_progress("Loading nations", 1, 1)
+        # One auto-commit statement, like aload_region
         async with self.client.asession() as session:
             await session.run(query, rows=rows)
 
@@ -110,6 +144,8 @@ class Neo4jLoader:
             } IN CONCURRENT TRANSACTIONS OF 1000 ROWS
         """
         printer.task_progress("Loading suppliers", 1, 1)
+        # One auto-commit statement, like aload_region; its 10,000 rows commit
+        # in concurrent inner transactions on the server
         async with self.client.asession() as session:
             await session.run(query, rows=rows)
 
@@ -117,81 +153,104 @@ class Neo4jLoader:
         num_batches = total_batches("customers", CHUNK_SIZE)
         query = """
             UNWIND $rows AS row
-            CALL (row) {
-                MATCH (nation:Nation {nationkey: row.nationkey})
-                CREATE (:Customer {custkey: row.custkey, name: row.name, address: row.address, phone: row.phone, acctbal: row.acctbal, mktsegment: row.mktsegment, comment: row.comment})-[:LOCATED_IN]->(nation)
-            } IN CONCURRENT TRANSACTIONS OF 1000 ROWS
+            MATCH (nation:Nation {nationkey: row.nationkey})
+            CREATE (:Customer {custkey: row.custkey, name: row.name, address: row.address, phone: row.phone, acctbal: row.acctbal, mktsegment: row.mktsegment, comment: row.comment})-[:LOCATED_IN]->(nation)
         """
-        for i, rows in enumerate(read_entity_chunks(CUSTOMER, CHUNK_SIZE), 1):
-            printer.task_progress("Loading customers", i, num_batches)
-            async with self.client.asession() as session:
-                await session.run(query, rows=rows)
+        await self._arun_batches("Loading customers", num_batches, query, read_entity_chunks(CUSTOMER, CHUNK_SIZE))
 
     async def aload_part(self) -> None:
         num_batches = total_batches("parts", CHUNK_SIZE)
         query = """
             UNWIND $rows AS row
-            CALL (row) {
-                CREATE (:Part {partkey: row.partkey, name: row.name, mfgr: row.mfgr, brand: row.brand, type: row.type, size: row.size, container: row.container, retailprice: row.retailprice, comment: row.comment})
-            } IN CONCURRENT TRANSACTIONS OF 1000 ROWS
+            CREATE (:Part {partkey: row.partkey, name: row.name, mfgr: row.mfgr, brand: row.brand, type: row.type, size: row.size, container: row.container, retailprice: row.retailprice, comment: row.comment})
         """
-        for i, rows in enumerate(read_entity_chunks(PART, CHUNK_SIZE), 1):
-            printer.task_progress("Loading parts", i, num_batches)
-            async with self.client.asession() as session:
-                await session.run(query, rows=rows)
+        await self._arun_batches("Loading parts", num_batches, query, read_entity_chunks(PART, CHUNK_SIZE))
 
     async def aload_partsupp(self) -> None:
         num_batches = total_batches("part_suppliers", CHUNK_SIZE_PARTSUPP)
         query = """
             UNWIND $rows AS row
-            CALL (row) {
-                MATCH (supplier:Supplier {suppkey: row.suppkey})
-                MATCH (part:Part {partkey: row.partkey})
-                CREATE (supplier)-[:SUPPLIES {availqty: row.availqty, supplycost: row.supplycost, comment: row.comment}]->(part)
-            } IN CONCURRENT TRANSACTIONS OF 1000 ROWS
+            MATCH (supplier:Supplier {suppkey: row.suppkey})
+            MATCH (part:Part {partkey: row.partkey})
+            CREATE (supplier)-[:SUPPLIES {availqty: row.availqty, supplycost: row.supplycost, comment: row.comment}]->(part)
         """
-        for i, rows in enumerate(read_entity_chunks(PARTSUPP, CHUNK_SIZE_PARTSUPP), 1):
-            printer.task_progress("Loading part_suppliers", i, num_batches)
-            async with self.client.asession() as session:
-                await session.run(query, rows=rows)
+        await self._arun_batches(
+            "Loading part_suppliers", num_batches, query, read_entity_chunks(PARTSUPP, CHUNK_SIZE_PARTSUPP)
+        )
 
     async def aload_orders(self) -> None:
         num_batches = total_batches("orders", CHUNK_SIZE_ORDERS)
         query = """
             UNWIND $rows AS row
-            CALL (row) {
-                MATCH (customer:Customer {custkey: row.custkey})
-                CREATE (customer)-[:PLACED]->(order:Order {orderkey: row.orderkey, orderstatus: row.orderstatus, totalprice: row.totalprice, orderdate: row.orderdate, orderpriority: row.orderpriority, clerk: row.clerk, shippriority: row.shippriority, comment: row.comment})
-            } IN CONCURRENT TRANSACTIONS OF 1000 ROWS
+            MATCH (customer:Customer {custkey: row.custkey})
+            CREATE (customer)-[:PLACED]->(order:Order {orderkey: row.orderkey, orderstatus: row.orderstatus, totalprice: row.totalprice, orderdate: row.orderdate, orderpriority: row.orderpriority, clerk: row.clerk, shippriority: row.shippriority, comment: row.comment})
         """
-        for i, rows in enumerate(read_entity_chunks(ORDER, CHUNK_SIZE_ORDERS), 1):
-            printer.task_progress("Loading orders", i, num_batches)
-            async with self.client.asession() as session:
-                await session.run(query, rows=rows)
+        await self._arun_batches("Loading orders", num_batches, query, read_entity_chunks(ORDER, CHUNK_SIZE_ORDERS))
 
     async def aload_lineitem(self) -> None:
         num_batches = total_batches("line_items", CHUNK_SIZE_LINEITEM)
         query = """
             UNWIND $rows AS row
-            CALL (row) {
-                MATCH (order:Order {orderkey: row.orderkey})
-                MATCH (part:Part {partkey: row.partkey})
-                MATCH (supplier:Supplier {suppkey: row.suppkey})
-                CREATE (lineitem:LineItem {
-                    linenumber: row.linenumber,
-                    quantity: row.quantity, extendedprice: row.extendedprice, discount: row.discount, tax: row.tax,
-                    returnflag: row.returnflag, linestatus: row.linestatus, shipdate: row.shipdate, commitdate: row.commitdate,
-                    receiptdate: row.receiptdate, shipinstruct: row.shipinstruct, shipmode: row.shipmode, comment: row.comment
-                })
-                CREATE (order)-[:CONTAINS]->(lineitem)
-                CREATE (lineitem)-[:OF_PART]->(part)
-                CREATE (lineitem)-[:SUPPLIED_BY]->(supplier)
-            } IN CONCURRENT TRANSACTIONS OF 1000 ROWS
+            MATCH (order:Order {orderkey: row.orderkey})
+            MATCH (part:Part {partkey: row.partkey})
+            MATCH (supplier:Supplier {suppkey: row.suppkey})
+            CREATE (lineitem:LineItem {
+                linenumber: row.linenumber,
+                quantity: row.quantity, extendedprice: row.extendedprice, discount: row.discount, tax: row.tax,
+                returnflag: row.returnflag, linestatus: row.linestatus, shipdate: row.shipdate, commitdate: row.commitdate,
+                receiptdate: row.receiptdate, shipinstruct: row.shipinstruct, shipmode: row.shipmode, comment: row.comment
+            })
+            CREATE (order)-[:CONTAINS]->(lineitem)
+            CREATE (lineitem)-[:OF_PART]->(part)
+            CREATE (lineitem)-[:SUPPLIED_BY]->(supplier)
+        """
+        await self._arun_batches(
+            "Loading line_items", num_batches, query, read_entity_chunks(LINEITEM, CHUNK_SIZE_LINEITEM)
+        )
+
+    async def _arun_batches(
+        self, label: str, num_batches: int, query: str, batches: Iterator[list[dict[str, Any]]]
+    ) -> None:
+        """Run ``query`` once per batch, with ``_BATCHES_IN_FLIGHT`` workers writing concurrently.
+
+        A producer parses batches in a worker thread, so the event loop stays
+        free while the CSV is read, and hands them to the workers through a
+        bounded queue. Each worker holds its own session, since sessions are not
+        safe for concurrent use, and writes every batch as one managed
+        transaction. Concurrent batches lock shared parent nodes (e.g., the
+        Supplier and Part of a line item), so the driver retries a batch that
+        fails with a transient error such as a deadlock. The whole batch rolls
+        back first, so a retry never duplicates rows. At most
+        ``2 * _BATCHES_IN_FLIGHT`` parsed batches wait in the queue at any time.
+
+        Args:
+            label: Progress message (e.g., ``"Loading customers"``).
+            num_batches: Total number of batches, for progress display.
+            query: Cypher query taking the batch as ``$rows``.
+            batches: Iterator of row batches.
         """
-        for i, rows in enumerate(read_entity_chunks(LINEITEM, CHUNK_SIZE_LINEITEM), 1):
-            printer.task_progress("Loading line_items", i, num_batches)
+        queue: asyncio.Queue[list[dict[str, Any]] | None] = asyncio.Queue(maxsize=2 * _BATCHES_IN_FLIGHT)
+
+        completed = 0
+
+        async def _aproduce() -> None:
+            while (rows := await asyncio.to_thread(next, batches, None)) is not None:
+                await queue.put(rows)
+            for _ in range(_BATCHES_IN_FLIGHT):
+                await queue.put(None)
+
+        async def _aconsume() -> None:
+            nonlocal completed
             async with self.client.asession() as session:
-                await session.run(query, rows=rows)
+                while (rows := await queue.get()) is not None:
+                    await session.execute_write(_arun_consumed, query, {"rows": rows})
+                    completed += 1
+                    printer.task_progress(label, completed, num_batches)
+
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(_aproduce())
+            for _ in range(_BATCHES_IN_FLIGHT):
+                tg.create_task(_aconsume())
 
     async def aclear(self) -> None:
         async with self.client.asession() as session:
@@ -211,26 +270,22 @@ class Neo4jLoader:
     async def __aexit__(self, exc_type, exc_value, traceback) -> None:  # type: ignore[no-untyped-def]
         await self.client.aclose()
 
-    async def _acreate_indices(self) -> None:
+    async def _acreate_index(self, name: str) -> None:
+        await self._arun_schema(_KEY_INDEXES[name])
         async with self.client.asession() as session:
-            for query in [
-                "CREATE INDEX region_key IF NOT EXISTS FOR (region:Region) ON (region.regionkey)",
-                "CREATE INDEX nation_key IF NOT EXISTS FOR (nation:Nation) ON (nation.nationkey)",
-                "CREATE INDEX supplier_key IF NOT EXISTS FOR (supplier:Supplier) ON (supplier.suppkey)",
-                "CREATE INDEX customer_key IF NOT EXISTS FOR (customer:Customer) ON (customer.custkey)",
-                "CREATE INDEX part_key IF NOT EXISTS FOR (part:Part) ON (part.partkey)",
-                "CREATE INDEX order_key IF NOT EXISTS FOR (order:Order) ON (order.orderkey)",
-            ]:
-                await session.run(query)
+            await session.run("CALL db.awaitIndexes(300)")
 
     async def _adrop_indices(self) -> None:
+        await asyncio.gather(*(self._arun_schema(f"DROP INDEX {name} IF EXISTS") for name in _KEY_INDEXES))
+
+    async def _arun_schema(self, query: str) -> None:
+        """Run a schema statement in a managed transaction.
+
+        The driver retries transient failures, such as schema lock contention
+        with another index operation, and raises once retries are exhausted.
+
+        Args:
+            query: Index DDL statement.
+        """
         async with self.client.asession() as session:
-            for query in [
-                "DROP INDEX region_key IF EXISTS",
-                "DROP INDEX nation_key IF EXISTS",
-                "DROP INDEX supplier_key IF EXISTS",
-                "DROP INDEX customer_key IF EXISTS",
-                "DROP INDEX part_key IF EXISTS",
-                "DROP INDEX order_key IF EXISTS",
-            ]:
-                await session.run(query)
+            await session.execute_write(_arun_consumed, query)
@@ -0,0 +1,15 @@
+"""Shared fixtures for the loader unit tests."""
+
+from pathlib import Path
+
+import pytest
+
+# A 10-row LineItem sample in dbgen format covering orders 1-5, with up to
+# four line items per order.
+SAMPLE_PATH = Path(__file__).parent / "data" / "tpch"
+
+
+@pytest.fixture
+def tpch_sample(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point ``graphonauts.base.tpch`` at the in-repo TPC-H sample."""
+    monkeypatch.setattr("graphonauts.base.tpch.TPCH_PATH", SAMPLE_PATH)
@@ -0,0 +1,43 @@
+"""Tests for ArangoDB LineItem batch construction."""
+
+import json
+
+import pytest
+
+from graphonauts.arangodb_db.loader import _lineitem_batch
+from graphonauts.base.tpch import LINEITEM, read_entity_frame_chunks
+
+
+@pytest.mark.usefixtures("tpch_sample")
+def test_lineitem_batch_builds_documents_and_edges() -> None:
+    (df,) = read_entity_frame_chunks(LINEITEM, 100, parse_dates=False)
+
+    batch = dict(_lineitem_batch(df))
+
+    assert list(batch) == ["LineItem", "contains", "of_part", "supplied_by"]
+    docs = {name: [json.loads(line) for line in body.splitlines()] for name, body in batch.items()}
+    keys = [doc["_key"] for doc in docs["LineItem"]]
+    assert keys == ["1_1", "1_2", "1_3", "2_1", "3_1", "3_2", "3_3", "3_4", "4_1", "5_1"]
+    assert docs["LineItem"][0] == {
+        "_key": "1_1",
+        "linenumber": 1,
+        "quantity": 17.0,
+        "extendedprice": 21168.23,
+        "discount": 0.04,
+        "tax": 0.02,
+        "returnflag": "N",
+        "linestatus": "O",
+        "shipdate": "1996-03-13",
+        "commitdate": "1996-02-12",
+        "receiptdate": "1996-03-22",
+        "shipinstruct": "DELIVER IN PERSON",
+        "shipmode": "TRUCK",
+        "comment": "egular courts above the",
+    }
+    assert docs["contains"][4] == {"_from": "Order/3", "_to": "LineItem/3_1"}
+    assert docs["of_part"][4] == {"_from": "LineItem/3_1", "_to": "Part/4297"}
+    assert docs["supplied_by"][4] == {"_from": "LineItem/3_1", "_to": "Supplier/1798"}
+    for name in ("contains", "of_part", "supplied_by"):
+        assert [edge["_from" if name != "contains" else "_to"] for edge in docs[name]] == [
+            f"LineItem/{key}" for key in keys
+        ]
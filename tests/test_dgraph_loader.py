@@ -0,0 +1,116 @@
+"""Tests for Dgraph mutation body construction."""
+
+import asyncio
+import json
+
+import pandas as pd  # type: ignore
+import pytest
+
+from graphonauts.base.tpch import LINEITEM, read_entity_frame
+from graphonauts.dgraph_db import loader as dgraph_loader
+from graphonauts.dgraph_db.loader import DgraphLoader, _json, _uid_lists
+from utils import printer
+
+
+class _RecordingClient:
+    """Stands in for ``DgraphClient``, keeping the bodies of every mutation."""
+
+    def __init__(self) -> None:
+        self.mutations: list[tuple[str, ...]] = []
+
+    async def amutate_json(self, *bodies: str) -> dict[str, str]:
+        await asyncio.sleep(0)
+        self.mutations.append(bodies)
+        return {}
+
+
+def test_json_serialises_selected_columns_per_row() -> None:
+    df = pd.DataFrame(
+        {
+            "uid": ["_:c1", "_:c2"],
+            "custkey": [1, 2],
+            "acctbal": [711.56, -9.99],
+            "located_in": [{"uid": "0x15"}, {"uid": "0x3"}],
+            "comment": ["to the even, regular", "not sent"],
+        }
+    )
+
+    body = _json(df, ["uid", "custkey", "acctbal", "located_in"])
+
+    assert json.loads(body) == [
+        {"uid": "_:c1", "custkey": 1, "acctbal": 711.56, "located_in": {"uid": "0x15"}},
+        {"uid": "_:c2", "custkey": 2, "acctbal": -9.99, "located_in": {"uid": "0x3"}},
+    ]
+
+
+def test_amutate_batches_reports_committed_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _RecordingClient()
+    loader = DgraphLoader(client)  # type: ignore[arg-type]
+    progress: list[tuple[str, int, int, int]] = []
+
+    def record(label: str, current: int, total: int) -> None:
+        progress.append((label, current, total, len(client.mutations)))
+
+    monkeypatch.setattr(printer, "task_progress", record)
+
+    asyncio.run(loader._amutate_batches("Loading customers", 6, iter([("[]",)] * 6)))
+
+    assert [(label, current, total) for label, current, total, _ in progress] == [
+        ("Loading customers", i, 6) for i in range(1, 7)
+    ]
+    # A batch is only counted once its mutation has returned
+    assert all(current <= committed for _, current, _, committed in progress)
+
+
+def test_uid_lists_groups_children_per_parent() -> None:
+    parents = {1: "0x1", 2: "0x2", 3: "0x3"}
+    keys = pd.Series([2, 2, 1, 2])
+    children = pd.Series(["_:li_21", "_:li_22", "_:li_11", "_:li_23"])
+
+    body = _uid_lists(parents, keys, children, "contains")
+
+    assert json.loads(body) == [
+        {"uid": "0x2", "contains": [{"uid": "_:li_21"}, {"uid": "_:li_22"}, {"uid": "_:li_23"}]},
+        {"uid": "0x1", "contains": [{"uid": "_:li_11"}]},
+    ]
+
+
+@pytest.mark.usefixtures("tpch_sample")
+def test_aload_lineitem_labels_and_links_line_items(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Three rows per batch splits orders 1 and 3 across mutations.
+    monkeypatch.setattr(dgraph_loader, "CHUNK_SIZE_LINEITEM", 3)
+    sample = read_entity_frame(LINEITEM, parse_dates=False)
+    client = _RecordingClient()
+    loader = DgraphLoader(client)  # type: ignore[arg-type]
+    loader._uid_cache = {
+        "Part": {key: f"0xp{key}" for key in sample["partkey"]},
+        "Supplier": {key: f"0xs{key}" for key in sample["suppkey"]},
+        "Order": {key: f"0xo{key}" for key in sample["orderkey"]},
+    }
+
+    asyncio.run(loader.aload_lineitem())
+
+    assert len(client.mutations) == 4
+    nodes = [node for body, _ in client.mutations for node in json.loads(body)]
+    labels = [node["uid"] for node in nodes]
+    expected = [
+        f"_:li_{orderkey * 10 + linenumber}"
+        for orderkey, linenumber in zip(sample["orderkey"], sample["linenumber"], strict=True)
+    ]
+    assert labels == expected
+    assert len(set(labels)) == len(labels)
+    assert nodes[4]["of_part"] == {"uid": "0xp4297"}
+    assert nodes[4]["supplied_by"] == {"uid": "0xs1798"}
+    assert nodes[4]["shipdate"] == "1994-02-02T00:00:00Z"
+
+    contains: dict[str, list[str]] = {}
+    for _, body in client.mutations:
+        for order in json.loads(body):
+            contains.setdefault(order["uid"], []).extend(child["uid"] for child in order["contains"])
+    assert contains == {
+        "0xo1": ["_:li_11", "_:li_12", "_:li_13"],
+        "0xo2": ["_:li_21"],
+        "0xo3": ["_:li_31", "_:li_32", "_:li_33", "_:li_34"],
+        "0xo4": ["_:li_41"],
+        "0xo5": ["_:li_51"],
+    }
@@ -0,0 +1,116 @@
+"""Tests for the Neo4j batch loading pipeline."""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+import pytest
+
+from graphonauts.neo4j_db.loader import _BATCHES_IN_FLIGHT, Neo4jLoader
+from utils import printer
+
+
+class _Result:
+    def __init__(self, tx: "_Transaction") -> None:
+        self.tx = tx
+
+    async def consume(self) -> None:
+        self.tx.consumed = True
+
+
+class _Transaction:
+    def __init__(self) -> None:
+        self.runs: list[tuple[str, dict[str, Any] | None]] = []
+        self.consumed = False
+
+    async def run(self, query: str, params: dict[str, Any] | None = None) -> _Result:
+        self.runs.append((query, params))
+        return _Result(self)
+
+
+class _Session:
+    def __init__(self, client: "_RecordingClient") -> None:
+        self.client = client
+
+    async def execute_write(self, work: Callable[..., Awaitable[None]], *args: Any) -> None:
+        self.client.active += 1
+        self.client.max_active = max(self.client.max_active, self.client.active)
+        try:
+            tx = _Transaction()
+            await asyncio.sleep(0)
+            await work(tx, *args)
+            assert tx.consumed, "result must be consumed inside the transaction"
+            self.client.fail_on(tx)
+            self.client.committed.extend(tx.runs)
+        finally:
+            self.client.active -= 1
+
+
+class _RecordingClient:
+    """Stands in for ``Neo4jClient``, keeping every committed transaction."""
+
+    def __init__(self, failing_batch: int | None = None) -> None:
+        self.failing_batch = failing_batch
+        self.committed: list[tuple[str, dict[str, Any] | None]] = []
+        self.sessions = 0
+        self.open_sessions = 0
+        self.active = 0
+        self.max_active = 0
+
+    def fail_on(self, tx: _Transaction) -> None:
+        for _, params in tx.runs:
+            if params is not None and params["rows"][0]["batch"] == self.failing_batch:
+                raise ValueError(f"batch {self.failing_batch} rejected")
+
+    @asynccontextmanager
+    async def asession(self) -> AsyncIterator[_Session]:
+        self.sessions += 1
+        self.open_sessions += 1
+        try:
+            yield _Session(self)
+        finally:
+            self.open_sessions -= 1
+
+
+def _batches(count: int) -> list[list[dict[str, Any]]]:
+    return [[{"batch": i, "row": j} for j in range(3)] for i in range(count)]
+
+
+def test_arun_batches_writes_each_batch_in_one_transaction(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _RecordingClient()
+    loader = Neo4jLoader(client)  # type: ignore[arg-type]
+    progress: list[tuple[str, int, int, int]] = []
+
+    def record(label: str, current: int, total: int) -> None:
+        progress.append((label, current, total, len(client.committed)))
+
+    monkeypatch.setattr(printer, "task_progress", record)
+    batches = _batches(10)
+
+    asyncio.run(loader._arun_batches("Loading parts", 10, "UNWIND $rows AS row", iter(batches)))
+
+    written = {params["rows"][0]["batch"]: params["rows"] for _, params in client.committed if params is not None}
+    assert len(client.committed) == 10
+    assert written == dict(enumerate(batches))
+    assert all(query == "UNWIND $rows AS row" for query, _ in client.committed)
+    assert 1 <= client.sessions <= _BATCHES_IN_FLIGHT
+    assert client.open_sessions == 0
+    assert client.max_active <= _BATCHES_IN_FLIGHT
+    assert [(label, current, total) for label, current, total, _ in progress] == [
+        ("Loading parts", i, 10) for i in range(1, 11)
+    ]
+    # A batch is only counted once its transaction has committed
+    assert all(current <= committed for _, current, _, committed in progress)
+
+
+def test_arun_batches_raises_for_failed_batch() -> None:
+    client = _RecordingClient(failing_batch=3)
+    loader = Neo4jLoader(client)  # type: ignore[arg-type]
+
+    with pytest.raises(ExceptionGroup) as excinfo:
+        asyncio.run(loader._arun_batches("Loading parts", 10, "UNWIND $rows AS row", iter(_batches(10))))
+
+    assert excinfo.group_contains(ValueError, match="batch 3 rejected")
+    assert client.open_sessions == 0
+    assert all(params is not None and params["rows"][0]["batch"] != 3 for _, params in client.committed)
@@ -0,0 +1,75 @@
+"""Tests for chunked TPC-H reading and row conversion."""
+
+import datetime
+import math
+
+import pandas as pd  # type: ignore
+import pytest
+
+from graphonauts.base import tpch
+from graphonauts.base.tpch import LINEITEM, read_entity_chunks, read_entity_frame, read_entity_frame_chunks
+
+
+@pytest.mark.usefixtures("tpch_sample")
+@pytest.mark.parametrize("block_size", [tpch._BLOCK_SIZE, 256])
+@pytest.mark.parametrize("chunk_size", [1, 3, 10, 25])
+def test_read_entity_frame_chunks_reslices_to_chunk_size(
+    monkeypatch: pytest.MonkeyPatch, block_size: int, chunk_size: int
+) -> None:
+    # A 256-byte block splits the sample across several Arrow batches whose row
+    # counts do not line up with chunk_size.
+    monkeypatch.setattr(tpch, "_BLOCK_SIZE", block_size)
+    full = read_entity_frame(LINEITEM)
+
+    chunks = list(read_entity_frame_chunks(LINEITEM, chunk_size))
+
+    assert len(chunks) == math.ceil(len(full) / chunk_size)
+    assert all(len(chunk) == chunk_size for chunk in chunks[:-1])
+    assert 0 < len(chunks[-1]) <= chunk_size
+    # Chunks carry their own category sets, so concatenating them may fall back
+    # to object columns; only the values have to match.
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks, ignore_index=True), full, check_dtype=False, check_categorical=False
+    )
+
+
+@pytest.mark.usefixtures("tpch_sample")
+def test_read_entity_frame_chunks_keeps_dates_as_text() -> None:
+    (chunk,) = read_entity_frame_chunks(LINEITEM, 100, parse_dates=False)
+
+    assert chunk.loc[0, ["shipdate", "commitdate", "receiptdate"]].tolist() == [
+        "1996-03-13",
+        "1996-02-12",
+        "1996-03-22",
+    ]
+    assert all(type(value) is str for value in chunk["receiptdate"])
+
+
+@pytest.mark.usefixtures("tpch_sample")
+def test_read_entity_chunks_round_trips_types() -> None:
+    rows = [row for chunk in read_entity_chunks(LINEITEM, 4) for row in chunk]
+
+    assert len(rows) == 10
+    assert rows[0] == {
+        "orderkey": 1,
+        "partkey": 155190,
+        "suppkey": 7706,
+        "linenumber": 1,
+        "quantity": 17.0,
+        "extendedprice": 21168.23,
+        "discount": 0.04,
+        "tax": 0.02,
+        "returnflag": "N",
+        "linestatus": "O",
+        "shipdate": datetime.date(1996, 3, 13),
+        "commitdate": datetime.date(1996, 2, 12),
+        "receiptdate": datetime.date(1996, 3, 22),
+        "shipinstruct": "DELIVER IN PERSON",
+        "shipmode": "TRUCK",
+        "comment": "egular courts above the",
+    }
+    for row in rows:
+        assert type(row["orderkey"]) is int
+        assert type(row["quantity"]) is float
+        assert type(row["returnflag"]) is str
+        assert type(row["shipdate"]) is datetime.date